@@ -7,8 +7,8 @@ import oyaml as yaml
 import audbackend
 import audeer
 
-from audmodel.core.backend import SERIALIZE_ERROR_MESSAGE
 from audmodel.core.backend import archive_path
+from audmodel.core.backend import dump_yaml
 from audmodel.core.backend import get_alias
 from audmodel.core.backend import get_aliases
 from audmodel.core.backend import get_archive
@@ -138,8 +138,12 @@ def exists(
         False
 
     """
+    cache_root = audeer.safe_path(default_cache_root())
     try:
-        url(uid)
+        # Looking up the header on the backend is sufficient,
+        # there is no need to download and parse it
+        short_id, version = split_uid(uid, cache_root)
+        header_path(short_id, version)
     except RuntimeError:
         return False
 
@@ -611,6 +615,11 @@ def publish(
             root,
         )
 
+    # Fail before accessing the backend
+    # if params or meta cannot be stored
+    dump_yaml(params)
+    dump_yaml(meta)
+
     short_id = utils.short_id(name, params, subgroup)
     uid = f"{short_id}-{version}"
 
@@ -668,7 +677,7 @@ def publish(
                 backend_interface,
                 verbose,
             )
-    except Exception as ex:
+    except Exception:
         # Otherwise remove already published files
         with backend_interface.backend:
             for ext in [define.HEADER_EXT, define.META_EXT, define.ALIASES_EXT]:
@@ -686,11 +695,7 @@ def publish(
                 name,
                 short_id + ".zip",
             )
-            if backend_interface.exists(path, version):  # pragma: no cover
-                # we can probably assume that the archive
-                # does not exist on the backend
-                # if something goes wrong during 'put_archive()'
-                # so it's not likely we'll ever end up in this case
+            if backend_interface.exists(path, version):
                 backend_interface.remove_file(path, version)
 
             if alias:
@@ -700,15 +705,9 @@ def publish(
                     f"{alias}.{define.ALIAS_EXT}",
                 )
                 if backend_interface.exists(path, "1.0.0"):
-                    backend_interface.remove_file(path, "1.0.0")  # pragma: no cover
-
-        # Reraise our custom error if params or meta cannot be serialized
-        if isinstance(ex, RuntimeError) and ex.args[0].startswith(
-            SERIALIZE_ERROR_MESSAGE
-        ):
-            raise ex
-        else:  # pragma: no cover
-            raise RuntimeError("Could not publish model due to an unexpected error.")
+                    backend_interface.remove_file(path, "1.0.0")
+
+        raise RuntimeError("Could not publish model due to an unexpected error.")
 
     return uid
 
@@ -1,4 +1,7 @@
+import collections
 from collections.abc import Sequence
+import copy
+import functools
 import os
 import shutil
 import tempfile
@@ -16,6 +19,23 @@ import audmodel.core.utils as utils
 
 SERIALIZE_ERROR_MESSAGE = "Cannot serialize the following object to a YAML file:\n"
 
+# Use the LibYAML based loader and dumper if available,
+# which are much faster than the pure Python implementations
+YAMLLoader = getattr(yaml, "CLoader", yaml.Loader)
+
+
+class YAMLDumper(getattr(yaml, "CDumper", yaml.Dumper)):
+    r"""YAML dumper that preserves the order of dictionary keys."""
+
+
+def _represent_dict(dumper: yaml.BaseDumper, data: dict) -> yaml.Node:
+    r"""Represent dictionary without sorting its keys."""
+    return dumper.represent_dict(data.items())
+
+
+YAMLDumper.add_representer(dict, _represent_dict)
+YAMLDumper.add_representer(collections.OrderedDict, _represent_dict)
+
 
 def archive_path(
     short_id: str,
@@ -173,8 +193,7 @@ def get_header(
                     shutil.move(tmp_path, local_path)
 
         # read header from local file
-        with open(local_path) as fp:
-            header = yaml.load(fp, Loader=yaml.Loader)
+        header = read_header(local_path)
 
     return backend_interface, header
 
@@ -245,7 +264,7 @@ def get_meta(
 
         # read metadata from local file
         with open(local_path) as fp:
-            meta = yaml.load(fp, Loader=yaml.Loader)
+            meta = yaml.load(fp, Loader=YAMLLoader)
             if meta is None:
                 meta = {}
 
@@ -594,7 +613,7 @@ def get_alias(
             )
             try:
                 with open(tmp_path) as fp:
-                    alias_data = yaml.load(fp, Loader=yaml.Loader)
+                    alias_data = yaml.load(fp, Loader=YAMLLoader)
             except yaml.YAMLError as yaml_ex:
                 raise RuntimeError(f"Failed to parse alias file: {yaml_ex}")
 
@@ -722,7 +741,7 @@ def get_aliases(
                 verbose=verbose,
             )
             with open(tmp_path) as fp:
-                aliases_data = yaml.load(fp, Loader=yaml.Loader)
+                aliases_data = yaml.load(fp, Loader=YAMLLoader)
                 if aliases_data is None or "aliases" not in aliases_data:
                     return backend_interface, []
 
@@ -787,6 +806,48 @@ def raise_model_not_found_error(
     raise RuntimeError(f"A model with ID '{uid}' does not exist.")
 
 
+def read_header(
+    path: str,
+) -> dict[str, object]:
+    r"""Read header from local file.
+
+    Parsed headers are kept in memory
+    and only read again from disk
+    if the modification time or size
+    of the file changes.
+
+    Args:
+        path: path to header file
+
+    Returns:
+        model header
+
+    """
+    stat = os.stat(path)
+    header = _parse_header(path, stat.st_mtime_ns, stat.st_size)
+    # Return a copy
+    # to protect the cached header
+    # against changes by the caller
+    return copy.deepcopy(header)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_header(
+    path: str,
+    mtime: int,
+    size: int,
+) -> dict[str, object]:
+    r"""Parse header file.
+
+    ``mtime`` and ``size`` are not used
+    inside the function,
+    but are part of the cache key.
+
+    """
+    with open(path) as fp:
+        return yaml.load(fp, Loader=YAMLLoader)
+
+
 def split_uid(
     uid: str,
     cache_root: str,
@@ -884,6 +945,27 @@ def split_uid(
     return short_id, version
 
 
+def dump_yaml(
+    obj: dict,
+) -> str:
+    r"""Serialize dictionary as YAML.
+
+    Args:
+        obj: object that should be serialized
+
+    Returns:
+        YAML string
+
+    Raises:
+        RuntimeError: if ``obj`` cannot be serialized
+
+    """
+    try:
+        return yaml.dump(obj, Dumper=YAMLDumper)
+    except Exception:
+        raise RuntimeError(f"{SERIALIZE_ERROR_MESSAGE}'{obj}'")
+
+
 def write_yaml(
     src_path: str,
     obj: dict,
@@ -899,8 +981,6 @@ def write_yaml(
             or file cannot be opened
 
     """
+    content = dump_yaml(obj)
     with open(src_path, "w") as fp:
-        try:
-            yaml.dump(obj, fp)
-        except Exception:
-            raise RuntimeError(f"{SERIALIZE_ERROR_MESSAGE}'{obj}'")
+        fp.write(content)
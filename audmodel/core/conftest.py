@@ -1,24 +1,44 @@
+import os
+
 import pytest
 
+import audeer
+
 import audmodel
 
 
-@pytest.fixture(autouse=True)
-def docstring_examples(doctest_namespace):  # pragma: no cover
-    r"""Publish model for doctests."""
-    repository = pytest.REPOSITORIES[0]
-    audmodel.config.REPOSITORIES = [repository]
-    subgroup = "audmodel.dummy.cnn"
-    for version, meta in pytest.META.items():
-        uid = audmodel.uid(
-            pytest.NAME,
-            pytest.PARAMS,
-            version,
-            subgroup=subgroup,
+@pytest.fixture(scope="session")
+def docstring_root(tmp_path_factory):  # pragma: no cover
+    r"""Provide root folder for doctests.
+
+    The doctests use their own cache and repository,
+    so that their output does not depend
+    on models published by the tests.
+
+    """
+    root = str(tmp_path_factory.mktemp("docstrings"))
+    audeer.mkdir(os.path.join(root, "model"))
+    return root
+
+
+@pytest.fixture(scope="session")
+def docstring_repository(docstring_root):  # pragma: no cover
+    r"""Publish models for doctests once per session."""
+    host = os.path.join(docstring_root, "host")
+    repository = audmodel.Repository("repo", host, "file-system")
+    audeer.mkdir(os.path.join(host, repository.name))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Ensure a cache root set by the user is not used
+        monkeypatch.delenv("AUDMODEL_CACHE_ROOT", raising=False)
+        monkeypatch.setattr(
+            audmodel.config,
+            "CACHE_ROOT",
+            os.path.join(docstring_root, "cache"),
         )
-        if not audmodel.exists(uid):
+        monkeypatch.setattr(audmodel.config, "REPOSITORIES", [repository])
+        for version, meta in pytest.META.items():
             audmodel.publish(
-                pytest.MODEL_ROOT,
+                os.path.join(docstring_root, "model"),
                 pytest.NAME,
                 pytest.PARAMS,
                 version,
@@ -26,10 +46,41 @@ def docstring_examples(doctest_namespace):  # pragma: no cover
                 date=pytest.DATE,
                 meta=meta,
                 repository=repository,
-                subgroup=subgroup,
+                subgroup="audmodel.dummy.cnn",
             )
+    return repository
+
+
+@pytest.fixture(autouse=True)
+def docstring_examples(
+    doctest_namespace,
+    monkeypatch,
+    docstring_root,
+    docstring_repository,
+):  # pragma: no cover
+    r"""Provide published models to doctests."""
+    monkeypatch.delenv("AUDMODEL_CACHE_ROOT", raising=False)
+    monkeypatch.setattr(
+        audmodel.config,
+        "CACHE_ROOT",
+        os.path.join(docstring_root, "cache"),
+    )
+    monkeypatch.setattr(audmodel.config, "REPOSITORIES", [docstring_repository])
     # Make model root and repo variables available in doctests
-    doctest_namespace["model_root"] = pytest.MODEL_ROOT
-    doctest_namespace["repository"] = repository
-    yield
-    audmodel.config.REPOSITORIES = pytest.REPOSITORIES
+    doctest_namespace["model_root"] = os.path.join(docstring_root, "model")
+    doctest_namespace["repository"] = docstring_repository
+
+
+def pytest_collection_modifyitems(items):  # pragma: no cover
+    r"""Run doctests in the same pytest-xdist worker.
+
+    The doctests depend on each other,
+    e.g. the example of ``versions()``
+    expects the model published
+    in the example of ``publish()``.
+
+    """
+    root = os.path.dirname(os.path.realpath(__file__))
+    for item in items:
+        if item.path.is_relative_to(root):
+            item.add_marker(pytest.mark.xdist_group("docstrings"))
@@ -1,7 +1,10 @@
 from contextlib import ExitStack
 from contextlib import contextmanager
 import os
+import threading
+import time
 import warnings
+import weakref
 
 from filelock import FileLock
 from filelock import Timeout
@@ -15,6 +18,15 @@ import audeer
 # which is needed for shared caches.
 _LOCK_FILE_MODE = 0o664
 
+# In-process locks for lock files.
+# Threads of the same process
+# wait on these locks
+# instead of polling the lock file.
+# Entries are removed automatically
+# once no thread references the lock anymore.
+_thread_locks = weakref.WeakValueDictionary()
+_thread_locks_guard = threading.Lock()
+
 
 @contextmanager
 def lock(
@@ -39,24 +51,64 @@ def lock(
 
     """
     lock_files = _lock_files(paths)
-    locks = [FileLock(f, timeout=timeout, mode=_LOCK_FILE_MODE) for f in lock_files]
     with ExitStack() as stack:
-        for lock, f in zip(locks, lock_files):
+        for f in lock_files:
+            thread_lock = _thread_lock(f)
+            file_lock = FileLock(f, mode=_LOCK_FILE_MODE)
             acquired = False
             if warn:
                 try:
-                    lock.acquire(timeout=0)
+                    _acquire(thread_lock, file_lock, f, 0)
                     acquired = True
                 except Timeout:
                     warnings.warn(
                         f"Could not acquire lock '{f}'; retrying for {timeout}s."
                     )
             if not acquired:
-                lock.acquire(timeout=timeout)
-            stack.enter_context(lock)
+                _acquire(thread_lock, file_lock, f, timeout)
+            # Release file lock before in-process lock
+            stack.callback(thread_lock.release)
+            stack.callback(file_lock.release)
         yield
 
 
+def _acquire(
+    thread_lock,
+    file_lock: FileLock,
+    lock_file: str,
+    timeout: float,
+):
+    """Acquire in-process lock and file lock.
+
+    The in-process lock is acquired first,
+    so that threads of the same process
+    are blocked without polling the lock file.
+    The file lock protects against other processes.
+
+    Args:
+        thread_lock: in-process lock
+        file_lock: file lock
+        lock_file: path to lock file
+        timeout: maximum time in seconds
+            before giving up acquiring both locks.
+            A negative value means to wait forever
+
+    Raises:
+        :class:`filelock.Timeout`: if a timeout is reached
+
+    """
+    start = time.monotonic()
+    if not thread_lock.acquire(timeout=-1 if timeout < 0 else timeout):
+        raise Timeout(lock_file)
+    if timeout > 0:
+        timeout = max(timeout - (time.monotonic() - start), 0)
+    try:
+        file_lock.acquire(timeout=timeout)
+    except BaseException:
+        thread_lock.release()
+        raise
+
+
 def _lock_files(paths: list[str]) -> list[str]:
     """Return lock file paths for given paths.
 
@@ -82,3 +134,21 @@ def _lock_files(paths: list[str]) -> list[str]:
         lock_file = audeer.path(dirname, f".{basename}.lock")
         lock_files.append(lock_file)
     return lock_files
+
+
+def _thread_lock(lock_file: str):
+    """Return in-process lock for given lock file.
+
+    Args:
+        lock_file: path to lock file
+
+    Returns:
+        in-process lock shared by all threads
+
+    """
+    with _thread_locks_guard:
+        thread_lock = _thread_locks.get(lock_file)
+        if thread_lock is None:
+            thread_lock = threading.RLock()
+            _thread_locks[lock_file] = thread_lock
+    return thread_lock
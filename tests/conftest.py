@@ -10,11 +10,13 @@ import audeer
 import audmodel
 
 
-pytest.ROOT = audeer.mkdir(
-    os.path.join(
-        os.path.dirname(os.path.realpath(__file__)),
-        audeer.uid(),
-    )
+# Folders below pytest.ROOT are created by the session fixture,
+# as conftest.py is imported as well by processes
+# that do not run any test,
+# e.g. the pytest-xdist controller
+pytest.ROOT = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    audeer.uid(),
 )
 
 pytest.NAME = "torch"
@@ -88,13 +90,11 @@ pytest.META = {
         },
     },
 }
-pytest.MODEL_ROOT = audeer.mkdir(os.path.join(pytest.ROOT, pytest.ID, "model"))
+pytest.MODEL_ROOT = os.path.join(pytest.ROOT, pytest.ID, "model")
 pytest.REPOSITORIES = [
     audmodel.Repository("repo1", pytest.HOST, "file-system"),
     audmodel.Repository("repo2", pytest.HOST, "file-system"),
 ]
-audeer.mkdir(audeer.path(pytest.HOST, "repo1"))
-audeer.mkdir(audeer.path(pytest.HOST, "repo2"))
 
 
 # create object that cannot be pickled
@@ -117,17 +117,25 @@ def cleanup_session():
     )
     for file in glob.glob(path):
         os.remove(file)
+    audeer.mkdir(pytest.MODEL_ROOT)
+    for repository in pytest.REPOSITORIES:
+        audeer.mkdir(audeer.path(pytest.HOST, repository.name))
     yield
-    if os.path.exists(pytest.ROOT):
-        shutil.rmtree(pytest.ROOT)
+    shutil.rmtree(pytest.ROOT, ignore_errors=True)
 
 
-@pytest.fixture(scope="function", autouse=False)
-def non_existing_repository():
-    repository = audmodel.Repository("repo", "non-existing", "file-system")
-    current_repositories = audmodel.config.REPOSITORIES
-    audmodel.config.REPOSITORIES = [repository]
+@pytest.fixture(scope="session", autouse=True)
+def configure_audmodel():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        # Ensure a cache root set by the user is not used
+        monkeypatch.delenv("AUDMODEL_CACHE_ROOT", raising=False)
+        monkeypatch.setattr(audmodel.config, "CACHE_ROOT", pytest.CACHE_ROOT)
+        monkeypatch.setattr(audmodel.config, "REPOSITORIES", pytest.REPOSITORIES)
+        yield
 
-    yield repository
 
-    audmodel.config.REPOSITORIES = current_repositories
+@pytest.fixture(scope="function", autouse=False)
+def non_existing_repository(monkeypatch):
+    repository = audmodel.Repository("repo", "non-existing", "file-system")
+    monkeypatch.setattr(audmodel.config, "REPOSITORIES", [repository])
+    return repository
@@ -5,11 +5,12 @@ import pytest
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 SUBGROUP = f"{pytest.ID}.alias"
 
+# Tests expect aliases and versions published by previous tests,
+# so they are executed by the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("alias")
+
 
 @pytest.fixture(scope="module")
 def published_model():
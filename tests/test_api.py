@@ -10,15 +10,16 @@ import audeer
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 MODEL_FILES = {
     "1.0.0": ["test", os.path.join("sub", "test")],
     "2.0.0": ["other", os.path.join("sub", "test")],
 }
 SUBGROUP = f"{pytest.ID}.load"
 
+# Publish the models of the module fixture only once,
+# by executing all tests in the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("api")
+
 
 def clear_root(root: str):
     root = audeer.safe_path(root)
@@ -197,18 +198,18 @@ def test_load(name, params, subgroup, version):
     files = audmodel.core.utils.scan_files(root)
     paths = [os.path.join(root, file) for file in files]
 
-    assert sorted(MODEL_FILES[version]) == sorted(files)
+    assert set(MODEL_FILES[version]) == set(files)
 
     # store modification times
 
-    mtimes = {path: os.path.getmtime(path) for path in paths}
-    mtimes[header] = os.path.getmtime(header)
+    mtimes = {path: os.stat(path).st_mtime_ns for path in paths}
+    mtimes[header] = os.stat(header).st_mtime_ns
 
     # load again from cache and assert modification times have not changed
 
     audmodel.load(uid)
     for path, mtime in mtimes.items():
-        assert os.path.getmtime(path) == mtime
+        assert os.stat(path).st_mtime_ns == mtime
 
     # load again from backend and assert modification times have changed
 
@@ -217,7 +218,7 @@ def test_load(name, params, subgroup, version):
     os.remove(header)
     audmodel.load(uid)
     for path, mtime in mtimes.items():
-        assert os.path.getmtime(path) != mtime
+        assert os.stat(path).st_mtime_ns != mtime
 
 
 @pytest.mark.parametrize(
@@ -1,11 +1,8 @@
 import pytest
 
-import audmodel
-from audmodel.core import backend
-
+import audeer
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
+from audmodel.core import backend
 
 
 def test_header_path_empty_version():
@@ -26,3 +23,49 @@ def test_header_path_empty_version():
     # Also test with None
     with pytest.raises(RuntimeError, match=error_msg):
         backend.header_path(short_id, None)
+
+
+def test_read_header(tmpdir):
+    """Test reading of cached header.
+
+    The parsed header is cached in memory,
+    and read again from disk
+    only if the file has changed.
+
+    """
+    path = audeer.path(tmpdir, "1.0.0.header.yaml")
+    backend.write_yaml(path, {"name": "torch"})
+    header = backend.read_header(path)
+    assert header == {"name": "torch"}
+
+    # Changing the returned header does not change the cached header
+    header["name"] = "onnx"
+    assert backend.read_header(path) == {"name": "torch"}
+
+    # Changed file is read again
+    backend.write_yaml(path, {"name": "torch", "version": "1.0.0"})
+    assert backend.read_header(path) == {"name": "torch", "version": "1.0.0"}
+
+
+def test_write_yaml(tmpdir):
+    """Test that dictionary keys are written in insertion order."""
+    path = audeer.path(tmpdir, "params.yaml")
+    backend.write_yaml(
+        path,
+        {
+            "model": "cnn10",
+            "data": "emodb",
+            "feature": {"win_dur": "32ms", "hop_dur": "10ms"},
+            "sampling_rate": 16000,
+        },
+    )
+    with open(path) as fp:
+        content = fp.read()
+    assert content == (
+        "model: cnn10\n"
+        "data: emodb\n"
+        "feature:\n"
+        "  win_dur: 32ms\n"
+        "  hop_dur: 10ms\n"
+        "sampling_rate: 16000\n"
+    )
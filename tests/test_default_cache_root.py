@@ -1,12 +1,8 @@
-import os
-
 import pytest
 
 import audmodel
 
 
-os.environ["AUDMODEL_CACHE_ROOT"] = pytest.CACHE_ROOT
-
-
-def test_default_cache_root():
+def test_default_cache_root(monkeypatch):
+    monkeypatch.setenv("AUDMODEL_CACHE_ROOT", pytest.CACHE_ROOT)
     assert audmodel.default_cache_root() == pytest.CACHE_ROOT
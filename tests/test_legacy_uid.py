@@ -8,13 +8,14 @@ import audeer
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 MODEL_FILES = ["test", "sub/test"]
 VERSION = "1.0.0"
 SUBGROUP = f"{pytest.ID}.legacy"
 
+# Publish the models of the module fixture only once,
+# by executing all tests in the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("legacy_uid")
+
 
 def clear_root(root: str):
     root = audeer.safe_path(root)
@@ -12,16 +12,13 @@ import audeer
 from audmodel.core.lock import lock
 
 
-event = threading.Event()
-
-
-def job(lock, wait, sleep):
+def job(lock, wait, sleep, barrier=None):
     if wait:
-        event.wait()  # wait for another thread to enter the lock
+        barrier.wait()  # wait for another thread to enter the lock
     try:
         with lock:
-            if not wait:
-                event.set()  # notify waiting threads to enter the lock
+            if not wait and barrier is not None:
+                barrier.wait()  # release waiting threads to enter the lock
             time.sleep(sleep)
     except filelock.Timeout:
         return 0
@@ -38,7 +35,6 @@ def test_lock(tmpdir):
     lock_1 = lock(lock_folders[0], warn=False)
     lock_2 = lock(lock_folders[1], warn=False)
 
-    event.clear()
     result = audeer.run_tasks(
         job,
         [
@@ -71,12 +67,12 @@ def test_lock(tmpdir):
     lock_1 = lock(lock_folders[0], warn=False)
     lock_12 = lock(lock_folders, warn=False)
 
-    event.clear()
+    barrier = threading.Barrier(2)
     result = audeer.run_tasks(
         job,
         [
-            ([lock_1, False, 0.2], {}),
-            ([lock_12, True, 0], {}),
+            ([lock_1, False, 0.1, barrier], {}),
+            ([lock_12, True, 0, barrier], {}),
         ],
         num_workers=2,
     )
@@ -87,12 +83,12 @@ def test_lock(tmpdir):
     lock_1 = lock(lock_folders[0], warn=False)
     lock_12 = lock(lock_folders, warn=False, timeout=0)
 
-    event.clear()
+    barrier = threading.Barrier(2)
     result = audeer.run_tasks(
         job,
         [
-            ([lock_1, False, 0.2], {}),
-            ([lock_12, True, 0], {}),
+            ([lock_1, False, 0.1, barrier], {}),
+            ([lock_12, True, 0, barrier], {}),
         ],
         num_workers=2,
     )
@@ -103,12 +99,12 @@ def test_lock(tmpdir):
     lock_1 = lock(lock_folders[0], warn=False)
     lock_12 = lock(lock_folders, warn=False)
 
-    event.clear()
+    barrier = threading.Barrier(2)
     result = audeer.run_tasks(
         job,
         [
-            ([lock_1, True, 0], {}),
-            ([lock_12, False, 0.2], {}),
+            ([lock_1, True, 0, barrier], {}),
+            ([lock_12, False, 0.1, barrier], {}),
         ],
         num_workers=2,
     )
@@ -119,12 +115,12 @@ def test_lock(tmpdir):
     lock_1 = lock(lock_folders[0], warn=False, timeout=0)
     lock_12 = lock(lock_folders, warn=False)
 
-    event.clear()
+    barrier = threading.Barrier(2)
     result = audeer.run_tasks(
         job,
         [
-            ([lock_1, True, 0], {}),
-            ([lock_12, False, 0.2], {}),
+            ([lock_1, True, 0, barrier], {}),
+            ([lock_12, False, 0.1, barrier], {}),
         ],
         num_workers=2,
     )
@@ -136,13 +132,13 @@ def test_lock(tmpdir):
     lock_2 = lock(lock_folders[1], warn=False, timeout=0)
     lock_12 = lock(lock_folders)
 
-    event.clear()
+    barrier = threading.Barrier(3)
     result = audeer.run_tasks(
         job,
         [
-            ([lock_1, True, 0], {}),
-            ([lock_2, True, 0], {}),
-            ([lock_12, 0, 0.2], {}),
+            ([lock_1, True, 0, barrier], {}),
+            ([lock_2, True, 0, barrier], {}),
+            ([lock_12, False, 0.1, barrier], {}),
         ],
         num_workers=3,
     )
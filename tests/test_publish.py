@@ -7,12 +7,13 @@ import audbackend
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 SUBGROUP = f"{pytest.ID}.publish"
 
 
+# The 'already published' cases expect
+# that the first case ran before in the same process,
+# so all cases are executed by the same pytest-xdist worker
+@pytest.mark.xdist_group("publish")
 @pytest.mark.parametrize(
     "root, name, params, version, author, date, meta, subgroup, repository",
     (
@@ -37,7 +38,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
         ),
         # different subgroup
         pytest.param(
@@ -49,7 +50,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             f"{SUBGROUP}.other",
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
         ),
         # different parameters
         pytest.param(
@@ -61,7 +62,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
         ),
         # new version
         pytest.param(
@@ -73,7 +74,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["2.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
         ),
         # new version in second repository
         pytest.param(
@@ -85,7 +86,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["3.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[1],
+            pytest.REPOSITORIES[1],
         ),
         # already published
         pytest.param(
@@ -97,7 +98,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
             marks=pytest.mark.xfail(raises=RuntimeError),
         ),
         pytest.param(
@@ -109,7 +110,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[1],
+            pytest.REPOSITORIES[1],
             marks=pytest.mark.xfail(raises=RuntimeError),
         ),
         # invalid root
@@ -122,7 +123,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             SUBGROUP,
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
             marks=pytest.mark.xfail(raises=FileNotFoundError),
         ),
         # invalid subgroup
@@ -135,7 +136,7 @@ SUBGROUP = f"{pytest.ID}.publish"
             pytest.DATE,
             pytest.META["1.0.0"],
             "_uid",
-            audmodel.config.REPOSITORIES[0],
+            pytest.REPOSITORIES[0],
             marks=pytest.mark.xfail(raises=ValueError),
         ),
     ),
@@ -183,9 +184,9 @@ def test_publish(root, name, subgroup, params, author, date, meta, version, repo
 
     assert audmodel.meta(uid) == meta
 
-    assert os.path.exists(audmodel.url(uid))
-    assert os.path.exists(audmodel.url(uid, type="header"))
-    assert os.path.exists(audmodel.url(uid, type="meta"))
+    urls = [audmodel.url(uid, type=t) for t in ("model", "header", "meta")]
+    missing = [url for url in urls if not os.path.exists(url)]
+    assert not missing, missing
 
 
 @pytest.mark.parametrize(
@@ -249,3 +250,44 @@ def test_publish_error(params, meta, repository, error, error_msg):
         version,
     )
     assert not audmodel.exists(uid)
+
+
+def test_publish_rollback(monkeypatch):
+    r"""Test removal of already published files on failure."""
+
+    def put_aliases(*args, **kwargs):
+        raise OSError("failure while uploading aliases")
+
+    # Fail after header, meta, archive, and alias were uploaded
+    monkeypatch.setattr(audmodel.core.api, "put_aliases", put_aliases)
+
+    name = pytest.NAME
+    params = pytest.PARAMS
+    version = "1.0.0"
+    alias = "publish-rollback"
+    subgroup = f"{SUBGROUP}.rollback"
+    with pytest.raises(RuntimeError, match="Could not publish model"):
+        audmodel.publish(
+            pytest.MODEL_ROOT,
+            name,
+            params,
+            version,
+            alias=alias,
+            repository=pytest.REPOSITORIES[0],
+            subgroup=subgroup,
+        )
+    uid = audmodel.uid(
+        name,
+        params,
+        version,
+        subgroup=subgroup,
+    )
+    assert not audmodel.exists(uid)
+    archive_root = os.path.join(
+        pytest.HOST,
+        pytest.REPOSITORIES[0].name,
+        *subgroup.split("."),
+    )
+    assert not [file for _, _, files in os.walk(archive_root) for file in files]
+    with pytest.raises(RuntimeError):
+        audmodel.resolve_alias(alias)
@@ -5,9 +5,6 @@ import pytest
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 SUBGROUP = f"{pytest.ID}.update"
 CACHE_ROOT_ALT = os.path.join(pytest.ROOT, "cache2")
 
@@ -3,9 +3,6 @@ import pytest
 import audmodel
 
 
-audmodel.config.CACHE_ROOT = pytest.CACHE_ROOT
-audmodel.config.REPOSITORIES = pytest.REPOSITORIES
-
 SUBGROUP = f"{pytest.ID}.versions"
 
 